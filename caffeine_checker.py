@@ -1,15 +1,64 @@
+import time
+_SCRIPT_START = time.perf_counter()
+
 import streamlit as st
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.colors import black, grey, darkblue
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import Paragraph
 import io
+import hashlib
+import html
+import json
+import sys
 from datetime import datetime
 import os
 
+# 시작 성능 프로파일링 (CAFFEINE_PROFILE_STARTUP=1 로 활성화)
+PROFILE_STARTUP = os.environ.get("CAFFEINE_PROFILE_STARTUP") == "1"
+_profile_marks = []
+_profile_last = [_SCRIPT_START]
+
+
+@st.cache_resource
+def profile_state():
+    """프로세스 단위 프로파일 출력 여부 - rerun과 세션 사이에 공유"""
+    return {"startup_reported": False, "first_report_reported": False}
+
+
+def process_uptime():
+    """프로세스 시작 후 경과 시간(초) - /proc 기준(클럭 틱 단위), 없으면 None"""
+    try:
+        with open("/proc/self/stat") as f:
+            # 22번째 필드 starttime - 프로세스 이름(괄호) 뒤부터 3번째 필드로 시작
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def profile_mark(phase, marks=_profile_marks, last=_profile_last):
+    """직전 지점부터 현재까지 걸린 시간을 phase 이름으로 기록"""
+    if not PROFILE_STARTUP:
+        return
+    now = time.perf_counter()
+    marks.append((phase, now - last[0]))
+    last[0] = now
+
+
+def report_profile(title, marks, state_key):
+    """프로세스당 한 번만 프로파일을 서버 로그에 출력 - 출력했으면 줄 목록 반환"""
+    state = profile_state()
+    if state[state_key]:
+        return None
+    state[state_key] = True
+
+    lines = [f"{phase:<28} {elapsed * 1000:8.1f} ms" for phase, elapsed in marks]
+    lines.append(f"{'합계':<28} {sum(elapsed for _, elapsed in marks) * 1000:8.1f} ms")
+    print(f"[{title}]\n" + "\n".join(lines), file=sys.stderr)
+    return lines
+
+
+profile_mark("모듈 import")
+
 # 기본 설정
 st.set_page_config(
     page_title="AI기반 맞춤형 카페인-약물 상호작용 분석기",
@@ -31,29 +80,32 @@ if 'user_data' not in st.session_state:
 if 'show_result' not in st.session_state:
     st.session_state.show_result = False
 
-# 폰트 디렉토리 확인 및 생성
 FONT_DIR = "fonts"
-if not os.path.exists(FONT_DIR):
-    os.makedirs(FONT_DIR)
-
-# 한글 폰트 처리 - 더 안전한 방식으로 수정
-try:
-    # 이미 폰트가 등록되어 있는지 확인
-    if 'NanumGothic' not in pdfmetrics._fonts:
-        # 폰트 파일이 존재하는지 확인
-        font_path = os.path.join(FONT_DIR, 'NanumGothic.ttf')
-        if not os.path.exists(font_path):
-            st.warning("한글 폰트 파일이 없습니다. PDF 생성 시 한글이 제대로 표시되지 않을 수 있습니다.")
-            # 기본 폰트 사용 (한글 깨질 수 있음)
-            FONT_NAME = "Helvetica"
-        else:
-            pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-            FONT_NAME = "NanumGothic"
-    else:
-        FONT_NAME = "NanumGothic"
-except Exception as e:
-    st.error(f"폰트 로딩 중 오류 발생: {e}")
-    FONT_NAME = "Helvetica"  # 기본 폰트로 대체
+FONT_PATH = os.path.join(FONT_DIR, 'NanumGothic.ttf')
+
+
+def load_pdf_font():
+    """한글 폰트 등록 - 첫 PDF 생성 시점에 reportlab과 함께 로드"""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    # 폰트 디렉토리 확인 및 생성
+    if not os.path.exists(FONT_DIR):
+        os.makedirs(FONT_DIR)
+
+    # 한글 폰트 처리 - 더 안전한 방식으로 수정
+    try:
+        # 이미 폰트가 등록되어 있는지 확인
+        if 'NanumGothic' not in pdfmetrics._fonts:
+            # 폰트 파일이 존재하는지 확인 (없다는 안내는 PDF 버튼 위에 표시)
+            if not os.path.exists(FONT_PATH):
+                # 기본 폰트 사용 (한글 깨질 수 있음)
+                return "Helvetica"
+            pdfmetrics.registerFont(TTFont('NanumGothic', FONT_PATH))
+        return "NanumGothic"
+    except Exception as e:
+        st.error(f"폰트 로딩 중 오류 발생: {e}")
+        return "Helvetica"  # 기본 폰트로 대체
 
 # UI 스타일링
 st.markdown("""
@@ -146,6 +198,8 @@ st.markdown("""
     <hr style='border: 1px solid #d3c0b0;'>
 """, unsafe_allow_html=True)
 
+profile_mark("페이지 설정 및 헤더")
+
 
 # 분석 함수들
 def get_drug_interaction(drug, symptoms, health_conditions):
@@ -237,249 +291,349 @@ def get_recommendation(caffeine_count, caffeine_time, drugs_list, health_conditi
     return tips
 
 
+# 결과지 섹션 구성 - PDF와 경량 결과지가 공통으로 사용
+REPORT_TITLE = "카페인-약물 궁합 분석 결과지"
+
+
+def build_report_sections(user_data):
+    """결과지 섹션 구성 - 기본 정보, 섭취 현황, 상호작용, 시간대, 권장사항
+
+    각 섹션은 key/title/items 로 구성되며, items 는 (label, [text, ...]) 목록이다.
+    label 이 None 이면 소제목 없이 본문만 있는 항목이다.
+    항목이 없는 섹션은 empty 에 대신 표시할 안내 문구를 둔다.
+    """
+    symptoms_text = ", ".join(user_data['symptom']) if user_data['symptom'] and "없음" not in user_data[
+        'symptom'] else "없음"
+    diseases_text = ", ".join(user_data['diseases']) if user_data['diseases'] and "없음" not in user_data[
+        'diseases'] else "없음"
+
+    interactions = [(d, [get_drug_interaction(d, user_data['symptom'], user_data['diseases'])])
+                    for d in user_data['drugs']]
+
+    timing = analyze_timing_interaction(user_data['drugs'], user_data['drink_time'], user_data['drug_time'])
+
+    safe_time = suggest_safe_caffeine_time(user_data['drugs'], user_data['drug_time'])
+    tips = get_recommendation(user_data['caffeine_intake'], user_data['drink_time'],
+                              user_data['drugs'], user_data['diseases'])
+
+    return [
+        {"key": "basic", "title": "개인 기본 정보", "items": [
+            ("성명", [user_data['name']]),
+            ("검사일", [user_data['test_date'].strftime('%Y년 %m월 %d일')]),
+            ("성별", [user_data['sex']]),
+            ("나이", [f"{user_data['age']}세"]),
+            ("체중", [f"{user_data['weight']}kg"]),
+            ("민감도", [user_data['sensitivity_level']]),
+        ]},
+        {"key": "intake", "title": "카페인 섭취 현황", "items": [
+            ("하루 카페인 섭취량", [f"{user_data['caffeine_intake']}잔 (약 {user_data['actual_mg']:.1f} mg)"]),
+            ("권장 섭취 한계", [f"{user_data['max_caffeine']:.1f} mg"]),
+            ("섭취 평가", [user_data['feedback']]),
+            ("주요 섭취 시간대", [user_data['drink_time']]),
+        ]},
+        {"key": "medication", "title": "약물 복용 정보", "items": [
+            ("복용 중인 약물", [', '.join(user_data['drugs']) if user_data['drugs'] else "없음"]),
+            ("주요 복용 시간대", [user_data['drug_time']]),
+            ("카페인 관련 증상", [symptoms_text]),
+            ("진단받은 질환", [diseases_text]),
+        ]},
+        {"key": "interactions", "title": "약물-카페인 상호작용 분석", "items": interactions,
+         "empty": "복용 중인 약물이 없습니다."},
+        {"key": "timing", "title": "카페인-약물 시간대 상호작용", "items": [(None, timing)] if timing else [],
+         "empty": "특별한 시간대 상호작용이 발견되지 않았습니다."},
+        {"key": "recommendations", "title": "맞춤형 권장사항", "items": [
+            ("권장 카페인 섭취 시간대", [safe_time]),
+            ("생활 습관 및 대체 음료", tips),
+        ]},
+        {"key": "notes", "title": "주의사항", "items": [
+            (None, [
+                "🔎 본 결과는 사용자 입력 기반이며, 전문가 진단을 대체하지 않습니다.",
+                "📌 식약처 기준: 성인 1일 400mg, 임산부 300mg 이하 권장",
+                "© 2025 카페인-약물 궁합 분석기 | Copyright Jungho Sohn",
+            ]),
+        ]},
+    ]
+
+
+def report_content_key(sections):
+    """분석 내용 키 - 결과지 섹션의 정규화된 JSON 해시 (같은 분석 결과 → 같은 값)"""
+    canonical = json.dumps(sections, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def report_etag(content_key, fmt):
+    """결과지 ETag - 분석 내용 키와 형식으로 결정 (결과지 렌더링 없이 계산)
+
+    결과지는 결정적으로 렌더링되므로 같은 키와 형식이면 바이트도 같다.
+    """
+    return '"' + hashlib.sha256(f"{fmt}:{content_key}".encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def section_items(section):
+    """섹션 항목 목록 - 항목이 없으면 안내 문구를 본문 항목으로 반환"""
+    if not section['items'] and section.get('empty'):
+        return [(None, [section['empty']])]
+    return section['items']
+
+
 # PDF 생성 함수 개선
-def generate_pdf(user_data):
-    """PDF 결과지 생성 - 개선된 레이아웃과 가독성"""
-    buffer = io.BytesIO()
+def generate_pdf(user_data, deterministic=True):
+    """PDF 결과지 생성 - 개선된 레이아웃과 가독성
 
+    deterministic=True 이면 생성 시각/문서 ID를 고정하여
+    같은 분석 내용이면 항상 같은 바이트의 PDF를 만든다 (캐시/ETag 용).
+    이 경우 분석 내용 키로 캐시하므로 같은 분석을 반복하면 다시 렌더링하지 않는다.
+    """
     if not user_data:
         st.error("사용자 데이터가 없습니다.")
         return None
 
     try:
-        pdf = canvas.Canvas(buffer, pagesize=A4)
-        pdf.setFont(FONT_NAME, 12)
-        pdf.setFillColor(black)
-
-        # 페이지 여백 및 너비 설정
-        margin = 50
-        page_width = A4[0] - 2 * margin
+        sections = build_report_sections(user_data)
+        if deterministic:
+            data = render_pdf_cached(report_content_key(sections), sections)
+        else:
+            data = draw_pdf(sections, deterministic=False)
+        return io.BytesIO(data)
+    except Exception as e:
+        st.error(f"PDF 생성 중 오류 발생: {e}")
+        return None
 
-        # 제목 및 기본 정보 - 시각적으로 분리
-        y = 780
-        pdf.setFont(FONT_NAME, 18)
-        pdf.setFillColor(darkblue)
-        pdf.drawString(margin, y, "카페인-약물 궁합 분석 결과지")
-        pdf.setFillColor(grey)
-        pdf.setFont(FONT_NAME, 10)
-        pdf.drawString(margin, y - 20, "by 카페인-약물 궁합 분석기 | © Jungho Sohn")
-
-        # 구분선
-        y -= 30
-        pdf.setStrokeColor(grey)
-        pdf.line(margin, y, A4[0] - margin, y)
-
-        # 기본 정보 섹션
-        y -= 30
-        pdf.setFillColor(black)
-        pdf.setFont(FONT_NAME, 14)
-        pdf.drawString(margin, y, "개인 기본 정보")
-        y -= 20
 
-        # 기본 정보 테이블 형식
-        pdf.setFont(FONT_NAME, 11)
-        data_items = [
-            ["성명:", user_data['name'], "검사일:", user_data['test_date'].strftime('%Y년 %m월 %d일')],
-            ["성별:", user_data['sex'], "나이:", f"{user_data['age']}세"],
-            ["체중:", f"{user_data['weight']}kg", "민감도:", user_data['sensitivity_level']]
-        ]
+@st.cache_data(show_spinner=False, max_entries=256)
+def render_pdf_cached(content_key, _sections):
+    """분석 내용 키 기준으로 캐시되는 결정적 PDF 렌더링 (_sections 는 해시하지 않음)"""
+    return draw_pdf(_sections, deterministic=True)
 
-        col_widths = [70, 130, 70, page_width - 270]
 
-        for items in data_items:
-            for i, item in enumerate(items):
-                pdf.drawString(margin + sum(col_widths[:i]), y, item)
+def draw_pdf(sections, deterministic):
+    """결과지 섹션을 PDF 바이트로 그림"""
+    buffer = io.BytesIO()
+    # PDF는 요청한 실행에서만 그려지므로 시작 프로파일과 별도 구간으로 기록
+    pdf_marks, pdf_last = [], [time.perf_counter()]
+
+    # reportlab은 첫 결과지 생성 시점에 로드 (앱 시작 속도 개선)
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.colors import black, grey, darkblue
+    profile_mark("reportlab import", pdf_marks, pdf_last)
+    FONT_NAME = load_pdf_font()
+    profile_mark("폰트 등록", pdf_marks, pdf_last)
+
+    sections = {section['key']: section for section in sections}
+
+    pdf = canvas.Canvas(buffer, pagesize=A4, invariant=1 if deterministic else 0)
+    pdf.setFont(FONT_NAME, 12)
+    pdf.setFillColor(black)
+
+    # 페이지 여백 및 너비 설정
+    margin = 50
+    page_width = A4[0] - 2 * margin
+
+    def draw_wrapped(text, y):
+        """멀티라인 텍스트 처리 - 페이지 너비에 맞춰 줄바꿈"""
+        words = text.split()
+        line = ""
+        for word in words:
+            test_line = line + " " + word if line else word
+            if pdf.stringWidth(test_line, FONT_NAME, 11) < page_width - 20:
+                line = test_line
+            else:
+                y = check_page_overflow(pdf, y, margin, FONT_NAME)
+                pdf.drawString(margin + 10, y, line)
+                y -= 15
+                line = word
+        if line:
+            y = check_page_overflow(pdf, y, margin, FONT_NAME)
+            pdf.drawString(margin + 10, y, line)
             y -= 20
+        return y
 
-        # 카페인 섭취 정보
-        y -= 20
+    def draw_heading(title, y):
+        """분석 섹션 제목"""
         pdf.setFont(FONT_NAME, 14)
-        pdf.drawString(margin, y, "카페인 섭취 현황")
-        y -= 20
-
+        pdf.setFillColor(darkblue)
+        pdf.drawString(margin, y, title)
+        pdf.setFillColor(black)
         pdf.setFont(FONT_NAME, 11)
-        pdf.drawString(margin, y, f"• 하루 카페인 섭취량: {user_data['caffeine_intake']}잔 (약 {user_data['actual_mg']:.1f} mg)")
+        return y - 25
+
+    # 제목 및 기본 정보 - 시각적으로 분리
+    y = 780
+    pdf.setFont(FONT_NAME, 18)
+    pdf.setFillColor(darkblue)
+    pdf.drawString(margin, y, REPORT_TITLE)
+    pdf.setFillColor(grey)
+    pdf.setFont(FONT_NAME, 10)
+    pdf.drawString(margin, y - 20, "by 카페인-약물 궁합 분석기 | © Jungho Sohn")
+
+    # 구분선
+    y -= 30
+    pdf.setStrokeColor(grey)
+    pdf.line(margin, y, A4[0] - margin, y)
+
+    # 기본 정보 섹션
+    y -= 30
+    pdf.setFillColor(black)
+    pdf.setFont(FONT_NAME, 14)
+    pdf.drawString(margin, y, sections['basic']['title'])
+    y -= 20
+
+    # 기본 정보 테이블 형식 (한 줄에 두 항목)
+    pdf.setFont(FONT_NAME, 11)
+    basic_items = sections['basic']['items']
+    col_widths = [70, 130, 70, page_width - 270]
+
+    for row_start in range(0, len(basic_items), 2):
+        row = []
+        for label, texts in basic_items[row_start:row_start + 2]:
+            row += [f"{label}:", ", ".join(texts)]
+        for i, item in enumerate(row):
+            pdf.drawString(margin + sum(col_widths[:i]), y, item)
         y -= 20
-        pdf.drawString(margin, y, f"• 권장 섭취 한계: {user_data['max_caffeine']:.1f} mg")
-        y -= 20
-        pdf.drawString(margin, y, f"• 섭취 평가: {user_data['feedback']}")
-        y -= 20
-        pdf.drawString(margin, y, f"• 주요 섭취 시간대: {user_data['drink_time']}")
-        y -= 30
 
-        # 약물 정보
+    # 카페인 섭취 정보 / 약물 정보
+    y -= 20
+    for key in ("intake", "medication"):
         pdf.setFont(FONT_NAME, 14)
-        pdf.drawString(margin, y, "약물 복용 정보")
+        pdf.drawString(margin, y, sections[key]['title'])
         y -= 20
 
         pdf.setFont(FONT_NAME, 11)
-        if user_data['drugs']:
-            pdf.drawString(margin, y, f"• 복용 중인 약물: {', '.join(user_data['drugs'])}")
-        else:
-            pdf.drawString(margin, y, "• 복용 중인 약물: 없음")
-        y -= 20
-        pdf.drawString(margin, y, f"• 주요 복용 시간대: {user_data['drug_time']}")
-        y -= 20
-
-        # 증상 및 질환
-        symptoms_text = ", ".join(user_data['symptom']) if user_data['symptom'] and "없음" not in user_data[
-            'symptom'] else "없음"
-        diseases_text = ", ".join(user_data['diseases']) if user_data['diseases'] and "없음" not in user_data[
-            'diseases'] else "없음"
-
-        pdf.drawString(margin, y, f"• 카페인 관련 증상: {symptoms_text}")
-        y -= 20
-        pdf.drawString(margin, y, f"• 진단받은 질환: {diseases_text}")
-        y -= 30
-
-        # 구분선
-        pdf.setStrokeColor(grey)
-        pdf.line(margin, y, A4[0] - margin, y)
-        y -= 30
-
-        # 약물-카페인 상호작용
-        pdf.setFont(FONT_NAME, 14)
-        pdf.setFillColor(darkblue)
-        pdf.drawString(margin, y, "약물-카페인 상호작용 분석")
-        y -= 25
-
-        pdf.setFillColor(black)
-        pdf.setFont(FONT_NAME, 11)
-
-        # 약물-카페인 상호작용 내용
-        if user_data['drugs']:
-            for d in user_data['drugs']:
-                interaction_msg = get_drug_interaction(d, user_data['symptom'], user_data['diseases'])
-                pdf.setFont(FONT_NAME if FONT_NAME == 'Helvetica' else FONT_NAME, 11)
-                pdf.drawString(margin, y, f"▶ {d}")
-                y -= 20
-
-                # 멀티라인 텍스트 처리
-                pdf.setFont(FONT_NAME, 11)
-                words = interaction_msg.split()
-                line = ""
-                for word in words:
-                    test_line = line + " " + word if line else word
-                    if pdf.stringWidth(test_line, FONT_NAME, 11) < page_width - 20:
-                        line = test_line
-                    else:
-                        y = check_page_overflow(pdf, y, margin, FONT_NAME)
-                        pdf.drawString(margin + 10, y, line)
-                        y -= 15
-                        line = word
-
-                if line:
-                    y = check_page_overflow(pdf, y, margin, FONT_NAME)
-                    pdf.drawString(margin + 10, y, line)
-                    y -= 20
-
-        else:
-            pdf.drawString(margin, y, "복용 중인 약물이 없습니다.")
+        for label, texts in sections[key]['items']:
+            pdf.drawString(margin, y, f"• {label}: {', '.join(texts)}")
             y -= 20
-
         y -= 10
 
-        # 시간대 상호작용
-        pdf.setFont(FONT_NAME, 14)
-        pdf.setFillColor(darkblue)
-        pdf.drawString(margin, y, "카페인-약물 시간대 상호작용")
-        y -= 25
+    # 구분선
+    pdf.setStrokeColor(grey)
+    pdf.line(margin, y, A4[0] - margin, y)
+    y -= 30
 
-        pdf.setFillColor(black)
-        pdf.setFont(FONT_NAME, 11)
+    # 약물-카페인 상호작용 / 시간대 상호작용
+    for key in ("interactions", "timing"):
+        y = draw_heading(sections[key]['title'], y)
 
-        interaction_msgs = analyze_timing_interaction(user_data['drugs'], user_data['drink_time'],
-                                                      user_data['drug_time'])
-        if interaction_msgs:
-            for msg in interaction_msgs:
-                words = msg.split()
-                line = ""
-                for word in words:
-                    test_line = line + " " + word if line else word
-                    if pdf.stringWidth(test_line, FONT_NAME, 11) < page_width - 20:
-                        line = test_line
-                    else:
-                        y = check_page_overflow(pdf, y, margin, FONT_NAME)
-                        pdf.drawString(margin + 10, y, line)
-                        y -= 15
-                        line = word
-                if line:
-                    y = check_page_overflow(pdf, y, margin, FONT_NAME)
-                    pdf.drawString(margin + 10, y, line)
+        if sections[key]['items']:
+            for label, texts in sections[key]['items']:
+                if label:
+                    pdf.setFont(FONT_NAME, 11)
+                    pdf.drawString(margin, y, f"▶ {label}")
                     y -= 20
+                    pdf.setFont(FONT_NAME, 11)
+                for text in texts:
+                    y = draw_wrapped(text, y)
         else:
-            pdf.drawString(margin, y, "특별한 시간대 상호작용이 발견되지 않았습니다.")
+            pdf.drawString(margin, y, sections[key]['empty'])
             y -= 20
 
         y -= 10
 
-        # 권장 섭취 시간대
-        pdf.setFont(FONT_NAME, 14)
-        pdf.setFillColor(darkblue)
-        pdf.drawString(margin, y, "맞춤형 권장사항")
-        y -= 25
-
-        pdf.setFillColor(black)
-        pdf.setFont(FONT_NAME, 11)
-
-        safe_time = suggest_safe_caffeine_time(user_data['drugs'], user_data['drug_time'])
-        pdf.drawString(margin, y, f"▶ 권장 카페인 섭취 시간대:")
+    # 맞춤형 권장사항
+    y = draw_heading(sections['recommendations']['title'], y)
+    for i, (label, texts) in enumerate(sections['recommendations']['items']):
+        if i:
+            y -= 5
+        pdf.drawString(margin, y, f"▶ {label}:")
         y -= 20
-        pdf.drawString(margin + 10, y, safe_time)
-        y -= 25
+        for text in texts:
+            y = draw_wrapped(text, y)
 
-        # 생활 습관 권장사항
-        pdf.drawString(margin, y, "▶ 생활 습관 및 대체 음료:")
-        y -= 20
-
-        tips = get_recommendation(user_data['caffeine_intake'], user_data['drink_time'],
-                                  user_data['drugs'], user_data['diseases'])
-        for tip in tips:
-            words = tip.split()
-            line = ""
-            for word in words:
-                test_line = line + " " + word if line else word
-                if pdf.stringWidth(test_line, FONT_NAME, 11) < page_width - 20:
-                    line = test_line
-                else:
-                    y = check_page_overflow(pdf, y, margin, FONT_NAME)
-                    pdf.drawString(margin + 10, y, line)
-                    y -= 15
-                    line = word
-            if line:
-                y = check_page_overflow(pdf, y, margin, FONT_NAME)
-                pdf.drawString(margin + 10, y, line)
-                y -= 20
+    # 주의사항 출력 전에 공간 부족 확인
+    y = check_page_overflow(pdf, y, margin, FONT_NAME)
 
-        # 주의사항 출력 전에 공간 부족 확인
-        y = check_page_overflow(pdf, y, margin, FONT_NAME)
+    pdf.setStrokeColor(grey)
+    pdf.line(margin, y, A4[0] - margin, y)
+    y -= 20
 
-        pdf.setStrokeColor(grey)
-        pdf.line(margin, y, A4[0] - margin, y)
-        y -= 20
+    pdf.setFont(FONT_NAME, 10)
+    y = check_page_overflow(pdf, y, margin, FONT_NAME)
+    pdf.drawString(margin, y, f"📌 {sections['notes']['title']}")
+    y -= 15
 
-        pdf.setFont(FONT_NAME, 10)
-        y = check_page_overflow(pdf, y, margin, FONT_NAME)
-        pdf.drawString(margin, y, "📌 주의사항")
-        y -= 15
-
-        pdf.setFont(FONT_NAME, 9)
-        for line in [
-            "🔎 본 결과는 사용자 입력 기반이며, 전문가 진단을 대체하지 않습니다.",
-            "📌 식약처 기준: 성인 1일 400mg, 임산부 300mg 이하 권장",
-            "© 2025 카페인-약물 궁합 분석기 | Copyright Jungho Sohn"
-        ]:
+    pdf.setFont(FONT_NAME, 9)
+    for _, texts in sections['notes']['items']:
+        for line in texts:
             y = check_page_overflow(pdf, y, margin, FONT_NAME)
             pdf.drawString(margin, y, line)
             y -= 12
 
-        pdf.showPage()
-        pdf.save()
-        buffer.seek(0)
-        return buffer
-    except Exception as e:
-        st.error(f"PDF 생성 중 오류 발생: {e}")
+    pdf.showPage()
+    pdf.save()
+    profile_mark("PDF 렌더링", pdf_marks, pdf_last)
+    if PROFILE_STARTUP:
+        report_profile("첫 PDF 결과지 생성 프로파일", pdf_marks, "first_report_reported")
+    return buffer.getvalue()
+
+
+# 경량 결과지 (HTML/JSON/텍스트) - reportlab 없이 생성
+REPORT_FORMATS = {
+    "html": ("text/html", "html"),
+    "json": ("application/json", "json"),
+    "text": ("text/plain", "txt"),
+}
+
+
+def write_report(user_data, fmt, out):
+    """결과지를 out(write 메서드를 가진 객체)에 섹션 단위로 기록"""
+    sections = build_report_sections(user_data)
+
+    if fmt == "html":
+        out.write(f"<!DOCTYPE html><html lang='ko'><head><meta charset='utf-8'><title>{REPORT_TITLE}</title>"
+                  "<style>body{font-family:sans-serif;max-width:720px;margin:2rem auto;color:#333}"
+                  "h1{color:#00008b}h2{color:#4b3832}</style></head><body>")
+        out.write(f"<h1>{REPORT_TITLE}</h1>")
+        for section in sections:
+            out.write(f"<h2>{html.escape(section['title'])}</h2><ul>")
+            for label, texts in section_items(section):
+                if label is None:
+                    for text in texts:
+                        out.write(f"<li>{html.escape(text)}</li>")
+                elif len(texts) == 1:
+                    out.write(f"<li><strong>{html.escape(label)}:</strong> {html.escape(texts[0])}</li>")
+                else:
+                    out.write(f"<li><strong>{html.escape(label)}:</strong><ul>")
+                    for text in texts:
+                        out.write(f"<li>{html.escape(text)}</li>")
+                    out.write("</ul></li>")
+            out.write("</ul>")
+        out.write("</body></html>")
+    elif fmt == "json":
+        out.write(f'{{"title": {json.dumps(REPORT_TITLE, ensure_ascii=False)}, "sections": [')
+        for i, section in enumerate(sections):
+            if i:
+                out.write(", ")
+            out.write(json.dumps({
+                "key": section['key'],
+                "title": section['title'],
+                "items": [{"label": label, "texts": texts} for label, texts in section_items(section)],
+            }, ensure_ascii=False))
+        out.write("]}")
+    elif fmt == "text":
+        out.write(f"{REPORT_TITLE}\n{'=' * len(REPORT_TITLE)}\n")
+        for section in sections:
+            out.write(f"\n[{section['title']}]\n")
+            for label, texts in section_items(section):
+                if label is None:
+                    for text in texts:
+                        out.write(f"- {text}\n")
+                elif len(texts) == 1:
+                    out.write(f"- {label}: {texts[0]}\n")
+                else:
+                    out.write(f"- {label}:\n")
+                    for text in texts:
+                        out.write(f"  - {text}\n")
+    else:
+        raise ValueError(f"지원하지 않는 결과지 형식입니다: {fmt}")
+
+
+def render_report(user_data, fmt):
+    """경량 결과지를 UTF-8 바이트로 생성"""
+    if not user_data:
         return None
+    out = io.StringIO()
+    write_report(user_data, fmt, out)
+    return out.getvalue().encode("utf-8")
 
 
 # 입력 섹션
@@ -537,6 +691,7 @@ st.markdown("""
         <div style='width: 300px;'>""", unsafe_allow_html=True)
 analyze_button = st.button("🔍 궁합 분석하기", key="analyze_button", use_container_width=True)
 st.markdown("</div></div>", unsafe_allow_html=True)
+profile_mark("입력 위젯")
 
 # 분석 버튼을 눌렀을 때 결과 저장
 if analyze_button:
@@ -595,9 +750,21 @@ if analyze_button:
         # 결과 표시 활성화
         st.session_state.show_result = True
 
-        # PDF 생성 및 세션에 저장
-        pdf_buffer = generate_pdf(st.session_state.user_data)
-        st.session_state.pdf_buffer = pdf_buffer
+        profile_mark("분석 계산")
+
+        # 분석 내용 키 - 같은 분석이면 같은 ETag, PDF는 캐시에서 재사용
+        report_key = report_content_key(build_report_sections(st.session_state.user_data))
+        st.session_state.report_key = report_key
+
+        # PDF는 "PDF 결과지 만들기"를 누를 때 생성 (경량 결과지만 받는 경우 reportlab 비용 없음)
+        st.session_state.pdf_etag = report_etag(report_key, "pdf")
+
+        # 경량 결과지 생성 및 세션에 저장
+        st.session_state.reports = {fmt: render_report(st.session_state.user_data, fmt)
+                                    for fmt in REPORT_FORMATS}
+        st.session_state.report_etags = {fmt: report_etag(report_key, fmt) for fmt in REPORT_FORMATS}
+
+profile_mark("분석 처리")
 
 # 결과 표시
 if st.session_state.show_result and st.session_state.user_data:
@@ -699,21 +866,46 @@ if st.session_state.show_result and st.session_state.user_data:
         </div>
         """, unsafe_allow_html=True)
 
-    # PDF 다운로드 버튼
-    if st.session_state.pdf_buffer:
+    # PDF 다운로드 버튼 - 요청한 분석에 대해서만 생성 (같은 분석이면 캐시에서 재사용)
+    if st.session_state.get('report_key'):
+        if not os.path.exists(FONT_PATH):
+            st.warning("한글 폰트 파일이 없습니다. PDF 생성 시 한글이 제대로 표시되지 않을 수 있습니다.")
         st.markdown("""
             <div style='display: flex; justify-content: center; margin: 20px 0;'>
                 <div style='width: 300px;'>""", unsafe_allow_html=True)
-        st.download_button(
-            label="📥 PDF 결과지 다운로드",
-            data=st.session_state.pdf_buffer,
-            file_name=f"카페인_약물_궁합분석_{user_data['name']}_{user_data['test_date'].strftime('%Y%m%d')}.pdf",
-            mime="application/pdf",
-            key="download_pdf",
-            use_container_width=True
-        )
+        if st.session_state.get('pdf_key') != st.session_state.report_key:
+            if st.button("📄 PDF 결과지 만들기", key="prepare_pdf", use_container_width=True):
+                st.session_state.pdf_key = st.session_state.report_key
+        if st.session_state.get('pdf_key') == st.session_state.report_key:
+            pdf_buffer = generate_pdf(user_data)
+            if pdf_buffer:
+                st.download_button(
+                    label="📥 PDF 결과지 다운로드",
+                    data=pdf_buffer,
+                    file_name=f"카페인_약물_궁합분석_{user_data['name']}_{user_data['test_date'].strftime('%Y%m%d')}.pdf",
+                    mime="application/pdf",
+                    key="download_pdf",
+                    use_container_width=True
+                )
+        st.caption(f"ETag: {st.session_state.get('pdf_etag')}")
         st.markdown("</div></div>", unsafe_allow_html=True)
 
+    # HTML/JSON/텍스트 다운로드 버튼
+    if st.session_state.get('reports'):
+        report_labels = {"html": "🌐 HTML", "json": "🧾 JSON", "text": "📝 텍스트"}
+        report_cols = st.columns(len(REPORT_FORMATS))
+        for col, (fmt, (mime, ext)) in zip(report_cols, REPORT_FORMATS.items()):
+            with col:
+                st.download_button(
+                    label=f"{report_labels[fmt]} 다운로드",
+                    data=st.session_state.reports[fmt],
+                    file_name=f"카페인_약물_궁합분석_{user_data['name']}_{user_data['test_date'].strftime('%Y%m%d')}.{ext}",
+                    mime=mime,
+                    key=f"download_{fmt}",
+                    use_container_width=True
+                )
+                st.caption(f"ETag: {st.session_state.report_etags[fmt]}")
+
     # 재시작 버튼
     st.markdown("""
         <div style='display: flex; justify-content: center; margin: 20px 0;'>
@@ -724,6 +916,8 @@ if st.session_state.show_result and st.session_state.user_data:
         st.experimental_rerun()
     st.markdown("</div></div>", unsafe_allow_html=True)
 
+profile_mark("결과 표시")
+
 # 앱 하단 정보 영역
 st.markdown("<hr style='border: 1px solid #d3c0b0;'>", unsafe_allow_html=True)
 st.markdown("""
@@ -733,3 +927,16 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
+# 시작 성능 프로파일 출력 - 프로세스의 첫 실행에서만 1회
+if PROFILE_STARTUP:
+    profile_mark("하단 정보")
+    if not profile_state()["startup_reported"]:
+        uptime = process_uptime()
+        if uptime is not None:
+            # 인터프리터 시작, streamlit import, 서버 기동, 첫 접속까지 - 스크립트 밖의 콜드 스타트 비용
+            script_elapsed = time.perf_counter() - _SCRIPT_START
+            _profile_marks.insert(0, ("프로세스 시작 → 첫 실행", max(0.0, uptime - script_elapsed)))
+    profile_lines = report_profile("시작 성능 프로파일", _profile_marks, "startup_reported")
+    if profile_lines:
+        with st.expander("⏱️ 시작 성능 프로파일"):
+            st.text("\n".join(profile_lines))
@@ -0,0 +1,315 @@
+"""카페인-약물 궁합 분석기 로컬 부하 테스트
+
+동시성 단계마다 127.0.0.1 에 `streamlit run --server.headless true` 서버를 하나 띄우고,
+브라우저와 같은 WebSocket 프로토콜(/_stcore/stream)로 여러 세션을 동시에 접속시킨다.
+각 세션은 첫 화면을 받고, 입력값을 채워 "🔍 궁합 분석하기"를 누른 뒤,
+"📄 PDF 결과지 만들기"를 눌러 나타난 PDF 다운로드 버튼의 /media URL에서 PDF를 내려받는다.
+외부 네트워크는 사용하지 않는다.
+
+출력 지표:
+    처리량       - 성공한 세션 수 / 단계 전체 경과 시간 (접속부터 PDF 수신까지)
+    p50/p95/p99  - 세션 1회(접속 → 첫 화면 → 분석 → PDF 수신) 지연시간
+    RSS/세션     - 모든 세션이 접속을 유지한 상태에서 잰 서버 프로세스 RSS 증가량 / 성공 세션 수
+                   (워밍업 세션 1회 이후를 기준으로 하므로 import/폰트 등록 비용은 제외)
+
+사용법:
+    python loadtest.py --concurrency 1 2 4 8 --sessions 40
+"""
+import argparse
+import asyncio
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "caffeine_checker.py")
+HOST = "127.0.0.1"
+SERVER_LOG_LINES = 20  # 오류 출력 시 함께 보여줄 서버 로그 줄 수
+
+DRUGS = [
+    "타이레놀 (아세트아미노펜)",
+    "이부프로펜, 덱시부프로펜 (NSAIDs)",
+    "항히스타민제 (세티리진, 레보세티리진, 클로르페니라민, 로라타딘, 펙소페나딘)",
+    "진정제/수면제 (로라제팜, 디아제팜, 졸피뎀)",
+    "위장약 (에소메프라졸, 오메프라졸, 라베프라졸 등 PPI 계열)",
+    "항우울제 (플루옥세틴, 에스시탈로프람, 설트랄린 등 SSRI 계열)",
+]
+
+
+def process_rss_kb(pid):
+    """프로세스 RSS(KB) - /proc 이 없으면 nan"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024
+    except (OSError, ValueError):
+        return float("nan")
+
+
+def free_port():
+    """사용 가능한 로컬 포트 번호"""
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, log_file, timeout):
+    """헤드리스 Streamlit 서버 실행 후 /_stcore/health 응답까지 대기"""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH,
+         "--server.headless", "true",
+         "--server.address", HOST,
+         "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        stdout=log_file, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Streamlit 서버가 종료되었습니다 (코드 {server.returncode}).")
+        try:
+            with urllib.request.urlopen(f"http://{HOST}:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    stop_server(server)
+    raise RuntimeError("Streamlit 서버가 제한 시간 안에 시작되지 않았습니다.")
+
+
+def stop_server(server):
+    """서버 프로세스 종료"""
+    server.terminate()
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+async def read_until_done(ws, session):
+    """ForwardMsg 수신 - 스크립트 실행 종료까지
+
+    새로 그려진 위젯은 session["widgets"] 에 종류별로 모은다.
+    """
+    while True:
+        msg = ForwardMsg()
+        msg.ParseFromString(await ws.recv())
+        kind = msg.WhichOneof("type")
+        if kind == "new_session":
+            session["id"] = msg.new_session.initialize.session_id
+        elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            element = msg.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "exception":
+                raise RuntimeError(f"앱 스크립트 오류: {element.exception.message}")
+            widget = getattr(element, element_type)
+            if getattr(widget, "id", ""):
+                session["widgets"].setdefault(element_type, []).append(widget)
+        elif kind == "script_finished":
+            if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                raise RuntimeError("앱 스크립트 컴파일 오류")
+            return msg
+
+
+def rerun_message(widget_values=()):
+    """스크립트 재실행 요청 - widget_values 는 (위젯, 값 필드, 값) 목록"""
+    msg = BackMsg()
+    msg.rerun_script.query_string = ""
+    msg.rerun_script.page_script_hash = ""
+    for widget, field, value in widget_values:
+        state = msg.rerun_script.widget_states.widgets.add()
+        state.id = widget.id
+        if field.endswith("_array_value"):
+            getattr(state, field).data.extend(value)
+        else:
+            setattr(state, field, value)
+    return msg
+
+
+def fetch(url, timeout):
+    """HTTP GET 본문"""
+    with urllib.request.urlopen(url, timeout=timeout) as r:
+        return r.read()
+
+
+async def drive_session(ws, port, session_id, timeout):
+    """WebSocket 세션 1회 - 첫 화면 → 입력/분석 → PDF 결과지 만들기 → /media 수신"""
+    rng = random.Random(session_id)
+    session = {"id": None, "widgets": {}}
+
+    # 첫 화면
+    await ws.send(rerun_message().SerializeToString())
+    await read_until_done(ws, session)
+    widgets, session["widgets"] = session["widgets"], {}
+
+    # 입력값 채우고 분석 버튼 클릭
+    analyze = next(w for w in widgets["button"] if w.id.endswith("analyze_button"))
+    await ws.send(rerun_message([
+        (widgets["text_input"][0], "string_value", f"사용자{session_id}"),
+        (widgets["radio"][0], "string_value", rng.choice(["남성", "여성"])),
+        (widgets["slider"][0], "double_array_value", [rng.randint(15, 80)]),
+        (widgets["number_input"][0], "double_value", float(rng.randint(40, 100))),
+        (widgets["multiselect"][0], "string_array_value", rng.sample(DRUGS, rng.randint(0, 3))),
+        (widgets["slider"][1], "double_array_value", [rng.randint(0, 6)]),
+        (widgets["radio"][2], "string_value", rng.choice(["오전", "오후 3시 이전", "오후 3시 이후"])),
+        (analyze, "trigger_value", True),
+    ]).SerializeToString())
+    await read_until_done(ws, session)
+
+    # "PDF 결과지 만들기" 클릭 후 나타나는 PDF 다운로드 버튼의 /media URL
+    prepare = next((w for w in session["widgets"].get("button", []) if w.id.endswith("prepare_pdf")), None)
+    if prepare is None:
+        raise RuntimeError("PDF 결과지 만들기 버튼이 표시되지 않았습니다.")
+    session["widgets"] = {}
+    await ws.send(rerun_message([(prepare, "trigger_value", True)]).SerializeToString())
+    await read_until_done(ws, session)
+    pdf_button = next((w for w in session["widgets"].get("download_button", [])
+                       if w.id.endswith("download_pdf")), None)
+    if pdf_button is None:
+        raise RuntimeError("PDF 다운로드 버튼이 표시되지 않았습니다.")
+
+    pdf = await asyncio.to_thread(fetch, f"http://{HOST}:{port}{pdf_button.url}", timeout)
+    if not pdf.startswith(b"%PDF"):
+        raise RuntimeError("PDF 결과지를 받지 못했습니다.")
+
+
+async def run_session(port, session_id, timeout, hold_connection):
+    """가상 세션 1회 실행 - PDF를 받은 뒤 hold_connection() 이 끝날 때까지 접속 유지"""
+    async with websockets.connect(f"ws://{HOST}:{port}/_stcore/stream",
+                                  subprotocols=["streamlit"], max_size=None) as ws:
+        await asyncio.wait_for(drive_session(ws, port, session_id, timeout), timeout)
+        await hold_connection()
+
+
+async def measure_session(port, session_id, timeout, slots, level):
+    """세션 1회 측정 - 결과 dict 반환 (예외 대신 traceback 기록)
+
+    동시 실행 슬롯(slots)은 PDF를 받는 즉시 반납하고, 접속은 level["done"] 까지 유지한다.
+    """
+    await slots.acquire()
+    start = time.perf_counter()
+    result = {"started_at": start, "finished_at": None, "error": None}
+
+    def finish():
+        result["finished_at"] = time.perf_counter()
+        slots.release()
+        level["finished"] += 1
+        if level["finished"] == level["sessions"]:
+            level["all_finished"].set()
+
+    async def hold_connection():
+        finish()
+        await level["done"].wait()
+
+    try:
+        await run_session(port, session_id, timeout, hold_connection)
+    except Exception:
+        result["error"] = traceback.format_exc()
+    if result["finished_at"] is None:
+        finish()
+    result["latency"] = result["finished_at"] - start
+    return result
+
+
+async def run_sessions(port, server_pid, concurrency, sessions, timeout):
+    """세션들을 동시성 제한 안에서 실행 - 결과 목록과 접속 유지 중 서버 RSS 증가량 반환"""
+    slots = asyncio.Semaphore(concurrency)
+    level = {"sessions": sessions, "finished": 0,
+             "all_finished": asyncio.Event(), "done": asyncio.Event()}
+    rss_before = process_rss_kb(server_pid)
+    tasks = [asyncio.create_task(measure_session(port, i, timeout, slots, level))
+             for i in range(sessions)]
+
+    # 모든 세션이 끝난 시점(성공 세션은 접속 유지 중)에 서버 RSS 측정
+    await level["all_finished"].wait()
+    rss_growth = process_rss_kb(server_pid) - rss_before
+    level["done"].set()
+    return await asyncio.gather(*tasks), rss_growth
+
+
+def percentile(values, pct):
+    """최근접 순위 방식 백분위수"""
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def run_level(concurrency, sessions, timeout):
+    """동시성 단계 1개 실행 - 단계마다 새 서버 프로세스 사용, 지표 dict 반환"""
+    with tempfile.TemporaryFile() as log_file:
+        port = free_port()
+        server = start_server(port, log_file, timeout)
+        try:
+            # 워밍업 - 모듈 import/폰트 등록 비용은 측정에서 제외 (실패는 이후 세션에서 집계)
+            asyncio.run(run_sessions(port, server.pid, 1, 1, timeout))
+            results, rss_growth = asyncio.run(run_sessions(port, server.pid, concurrency, sessions, timeout))
+        finally:
+            stop_server(server)
+        log_file.seek(0)
+        server_log = log_file.read().decode(errors="replace").strip().splitlines()[-SERVER_LOG_LINES:]
+
+    ok = [r for r in results if r["error"] is None]
+    failed = [r for r in results if r["error"] is not None]
+    latencies = [r["latency"] for r in ok]
+    if ok:
+        elapsed = max(r["finished_at"] for r in ok) - min(r["started_at"] for r in ok)
+    else:
+        elapsed = 0.0
+
+    return {
+        "concurrency": concurrency,
+        "sessions": sessions,
+        "errors": len(failed),
+        "first_error": (failed[0]["error"] + "[서버 로그]\n" + "\n".join(server_log)) if failed else None,
+        "throughput": len(ok) / elapsed if elapsed else float("nan"),
+        "p50": percentile(latencies, 50) if latencies else float("nan"),
+        "p95": percentile(latencies, 95) if latencies else float("nan"),
+        "p99": percentile(latencies, 99) if latencies else float("nan"),
+        "mem_per_session_kb": rss_growth / len(ok) if ok else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="카페인-약물 궁합 분석기 로컬 부하 테스트")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="동시 세션 수 단계 (기본: 1 2 4 8)")
+    parser.add_argument("--sessions", type=int, default=20, help="단계별 세션 수 (기본: 20)")
+    parser.add_argument("--timeout", type=float, default=60, help="서버 시작 및 세션별 제한 시간(초)")
+    args = parser.parse_args()
+
+    print(f"{'동시성':>6} {'세션':>6} {'오류':>4} {'처리량(/s)':>11} "
+          f"{'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'서버RSS/세션(KB)':>17}")
+    failed_levels = 0
+    for concurrency in args.concurrency:
+        r = run_level(concurrency, args.sessions, args.timeout)
+        row = f"{r['concurrency']:>6} {r['sessions']:>6} {r['errors']:>4} "
+        if r["errors"] * 2 > r["sessions"]:
+            # 절반 이상 실패한 단계의 지표는 의미가 없으므로 출력하지 않음
+            row += f"{'-':>11} {'-':>9} {'-':>9} {'-':>9} {'-':>17}  ✗ 무효 (과반 실패)"
+        else:
+            row += (f"{r['throughput']:>11.2f} {r['p50'] * 1000:>9.1f} {r['p95'] * 1000:>9.1f} "
+                    f"{r['p99'] * 1000:>9.1f} {r['mem_per_session_kb']:>17.1f}")
+            if r["errors"]:
+                row += "  ⚠ 일부 실패"
+        print(row)
+        if r["first_error"]:
+            failed_levels += 1
+            print(f"  첫 번째 오류 (동시성 {concurrency}):", file=sys.stderr)
+            print("    " + r["first_error"].rstrip().replace("\n", "\n    "), file=sys.stderr)
+
+    if failed_levels:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()